@@ -2,7 +2,6 @@
 """PyInstaller entry point"""
 
 import sys
-sys.path.insert(0, 'src')
 
 from shoboi_tag_editor.main import main
 
@@ -6,7 +6,7 @@ from PyQt6.QtCore import QLocale, QTranslator
 from PyQt6.QtWidgets import QApplication
 
 from .mainwindow import MainWindow
-from .translations import TRANSLATIONS_DIR
+from .translations import JA_QM, JA_QM_EXISTS
 
 
 def main() -> int:
@@ -17,9 +17,8 @@ def main() -> int:
     translator = QTranslator()
     locale = QLocale.system().name()
 
-    if locale.startswith("ja"):
-        translation_file = TRANSLATIONS_DIR / "shoboi_tag_editor_ja.qm"
-        if translation_file.exists() and translator.load(str(translation_file)):
+    if JA_QM_EXISTS and locale.startswith("ja"):
+        if translator.load(str(JA_QM)):
             app.installTranslator(translator)
 
     window = MainWindow()
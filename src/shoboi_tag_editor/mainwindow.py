@@ -1,5 +1,7 @@
 """Main window implementation"""
 
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from PyQt6.QtCore import Qt
@@ -9,12 +11,13 @@ from PyQt6.QtWidgets import (
     QHeaderView,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QToolBar,
     QVBoxLayout,
     QWidget,
 )
 
-from .metadata import is_supported_file, read_metadata, write_metadata
+from .metadata import find_supported_files, is_supported_file, read_metadata, write_metadata
 from .tablemodel import MetadataTableModel
 from .tableview import NavigableTableView
 
@@ -22,18 +25,38 @@ from .tableview import NavigableTableView
 class MainWindow(QMainWindow):
     """Main window for the music metadata editor"""
 
+    # Worker threads for file I/O (reading and writing is I/O-bound)
+    MAX_IO_WORKERS = (os.cpu_count() or 1) * 2
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Shoboi Tag Editor")
         self.setMinimumSize(900, 600)
 
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_IO_WORKERS)
         self._model = MetadataTableModel(self)
+        self._setup_strings()
         self._setup_ui()
         self._setup_actions()
         self._setup_toolbar()
 
         self.setAcceptDrops(True)
 
+    def _setup_strings(self) -> None:
+        """Translate the strings used by event handlers once"""
+        self._str_save = self.tr("Save")
+        self._str_confirm = self.tr("Confirm")
+        self._str_select_files = self.tr("Select Music Files")
+        self._str_file_filter = self.tr("Music Files (*.mp3 *.m4a *.flac);;All Files (*)")
+        self._str_load_error = self.tr("Load Error")
+        self._str_load_failed = self.tr("Failed to load file:")
+        self._str_loading = self.tr("Loading files...")
+        self._str_no_modified = self.tr("No modified tracks.")
+        self._str_saving = self.tr("Saving files...")
+        self._str_save_error = self.tr("Save Error")
+        self._str_save_failed = self.tr("Failed to save some files:")
+        self._str_save_complete = self.tr("Save Complete")
+
     def _setup_ui(self) -> None:
         """Set up the UI"""
         central = QWidget()
@@ -67,7 +90,7 @@ class MainWindow(QMainWindow):
         self._open_action.setShortcut(QKeySequence.StandardKey.Open)
         self._open_action.triggered.connect(self._on_open_files)
 
-        self._save_action = QAction(self.tr("Save"), self)
+        self._save_action = QAction(self._str_save, self)
         self._save_action.setShortcut(QKeySequence.StandardKey.Save)
         self._save_action.triggered.connect(self._on_save)
 
@@ -89,59 +112,119 @@ class MainWindow(QMainWindow):
         """Show the open file dialog"""
         files, _ = QFileDialog.getOpenFileNames(
             self,
-            self.tr("Select Music Files"),
+            self._str_select_files,
             "",
-            self.tr("Music Files (*.mp3 *.m4a *.flac);;All Files (*)"),
+            self._str_file_filter,
         )
 
         self._add_files([Path(f) for f in files])
 
     def _add_files(self, file_paths: list[Path]) -> None:
         """Add files"""
-        for file_path in file_paths:
-            if not file_path.is_file():
-                continue
-            if not is_supported_file(file_path):
-                continue
-            if self._model.has_file(file_path):
-                continue
-
-            try:
-                metadata = read_metadata(file_path)
-                self._model.add_track(metadata)
-            except Exception as e:
-                QMessageBox.warning(
-                    self,
-                    self.tr("Load Error"),
-                    self.tr("Failed to load file:") + f"\n{file_path}\n\n{e}",
-                )
+        # dict.fromkeys drops duplicates while keeping the order
+        targets = [
+            file_path
+            for file_path in dict.fromkeys(file_paths)
+            if file_path.is_file()
+            and is_supported_file(file_path)
+            and not self._model.has_file(file_path)
+        ]
+
+        if not targets:
+            return
+
+        progress = QProgressDialog(self._str_loading, None, 0, len(targets), self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        # Read files in parallel, but only touch the model from the GUI thread
+        futures = [
+            (file_path, self._executor.submit(read_metadata, file_path)) for file_path in targets
+        ]
+        pending = {future for _, future in futures}
+        errors = []
+        # Index of the first future whose result has not been added yet
+        next_result = 0
+        while next_result < len(futures):
+            _, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+
+            # Add finished reads as they complete, keeping the order of the files
+            tracks = []
+            while next_result < len(futures) and futures[next_result][1].done():
+                file_path, future = futures[next_result]
+                try:
+                    tracks.append(future.result())
+                except Exception as e:
+                    errors.append((file_path, e))
+                next_result += 1
+            # One beginInsertRows/endInsertRows pair per batch
+            self._model.add_unique(tracks)
+
+            # setValue() also processes events while the dialog is modal
+            progress.setValue(len(futures) - len(pending))
+        progress.close()
+        # close() only hides the dialog; it is parented to the window
+        progress.deleteLater()
+
+        for file_path, e in errors:
+            QMessageBox.warning(
+                self,
+                self._str_load_error,
+                self._str_load_failed + f"\n{file_path}\n\n{e}",
+            )
 
     def _on_save(self) -> None:
         """Save modified metadata"""
-        modified = self._model.get_modified_tracks()
+        # Skip tracks whose fields ended up equal to what is on disk
+        modified = []
+        unchanged = []
+        for track in self._model.get_modified_tracks():
+            if track.cover_dirty or track != self._model.original_for(track):
+                modified.append(track)
+            else:
+                unchanged.append(track)
         if not modified:
-            QMessageBox.information(self, self.tr("Save"), self.tr("No modified tracks."))
+            self._model.mark_all_saved()
+            QMessageBox.information(self, self._str_save, self._str_no_modified)
             return
 
+        progress = QProgressDialog(self._str_saving, None, 0, len(modified), self)
+        progress.setWindowTitle(self._str_save)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        futures = [(track, self._executor.submit(write_metadata, track)) for track in modified]
+        pending = {future for _, future in futures}
+        while pending:
+            _, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            # setValue() also processes events while the dialog is modal
+            progress.setValue(len(futures) - len(pending))
+        progress.close()
+        progress.deleteLater()
+
+        saved = []
         errors = []
-        for track in modified:
-            try:
-                write_metadata(track)
-            except Exception as e:
+        for track, future in futures:
+            e = future.exception()
+            if e is None:
+                saved.append(track)
+            else:
                 errors.append(f"{track.file_path.name}: {e}")
 
-        self._model.mark_all_saved()
+        # Failed tracks stay modified so that the next save retries them, while
+        # reverted edits match the file and are no longer modified
+        self._model.mark_all_saved(saved + unchanged)
 
         if errors:
             QMessageBox.warning(
                 self,
-                self.tr("Save Error"),
-                self.tr("Failed to save some files:") + "\n\n" + "\n".join(errors),
+                self._str_save_error,
+                self._str_save_failed + "\n\n" + "\n".join(errors),
             )
         else:
             QMessageBox.information(
                 self,
-                self.tr("Save Complete"),
+                self._str_save_complete,
                 self.tr("Saved %n file(s).", "", len(modified)),
             )
 
@@ -151,7 +234,7 @@ class MainWindow(QMainWindow):
         if modified:
             reply = QMessageBox.question(
                 self,
-                self.tr("Confirm"),
+                self._str_confirm,
                 self.tr("There are %n unsaved change(s). Clear anyway?", "", len(modified)),
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No,
@@ -175,8 +258,7 @@ class MainWindow(QMainWindow):
             if url.isLocalFile():
                 path = Path(url.toLocalFile())
                 if path.is_dir():
-                    for ext in [".mp3", ".m4a", ".flac"]:
-                        file_paths.extend(path.rglob(f"*{ext}"))
+                    file_paths.extend(find_supported_files(path))
                 else:
                     file_paths.append(path)
 
@@ -189,7 +271,7 @@ class MainWindow(QMainWindow):
         if modified:
             reply = QMessageBox.question(
                 self,
-                self.tr("Confirm"),
+                self._str_confirm,
                 self.tr("There are %n unsaved change(s). Exit anyway?", "", len(modified)),
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No,
@@ -198,4 +280,5 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
 
+        self._executor.shutdown(wait=False)
         event.accept()
@@ -1,15 +1,14 @@
-"""Module for reading and writing music file metadata"""
+"""Module for reading and writing music file metadata
 
+mutagen format modules are imported inside the per-format functions so that
+starting the application does not load them until a file is opened.
+"""
+
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from mutagen.easyid3 import EasyID3
-from mutagen.easymp4 import EasyMP4
-from mutagen.flac import FLAC, Picture
-from mutagen.id3 import APIC, ID3, ID3NoHeaderError
-from mutagen.mp4 import MP4, MP4Cover
-from mutagen.mp3 import MP3
-
 
 @dataclass
 class TrackMetadata:
@@ -25,6 +24,15 @@ class TrackMetadata:
     cover_image: bytes | None = field(default=None, compare=False)
     cover_mime: str = field(default="image/jpeg", compare=False)
     modified: bool = field(default=False, compare=False)
+    # Whether the cover image needs to be written back to the file
+    cover_dirty: bool = field(default=False, compare=False)
+    # Cache key of the cover thumbnail; reset whenever cover_image is replaced
+    cover_key: str | None = field(default=None, compare=False, repr=False)
+    # file_path.name, cached because the table shows it on every repaint
+    file_name: str = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.file_name = self.file_path.name
 
     def copy_from(self, other: "TrackMetadata") -> None:
         """Copy metadata from another TrackMetadata"""
@@ -36,6 +44,8 @@ class TrackMetadata:
         self.genre = other.genre
         self.cover_image = other.cover_image
         self.cover_mime = other.cover_mime
+        self.cover_key = other.cover_key
+        self.cover_dirty = True
 
 
 SUPPORTED_EXTENSIONS = {".mp3", ".m4a", ".flac"}
@@ -46,117 +56,170 @@ def is_supported_file(path: Path) -> bool:
     return path.suffix.lower() in SUPPORTED_EXTENSIONS
 
 
+def find_supported_files(root: Path) -> Iterator[Path]:
+    """Recursively yield supported files under a directory"""
+    # A single os.scandir pass per directory; symlinked directories are not followed
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        yield Path(entry.path)
+        except OSError:
+            # Skip unreadable directories
+            continue
+
+
+def _as_str(value) -> str:
+    """Return value as str, skipping the conversion for plain strings"""
+    # Tag values are almost always str already; only e.g. ID3TimeStamp needs str()
+    return value if isinstance(value, str) else str(value)
+
+
 def _get_first_value(tags: dict, key: str) -> str:
     """Get the first value from tags"""
-    values = tags.get(key, [])
+    values = tags.get(key)
     if values:
-        return str(values[0])
+        return _as_str(values[0])
     return ""
 
 
+# Easy-style keys (EasyMP4 and Vorbis comments) backing each text field
+_EASY_TEXT_KEYS = (
+    ("title", "title"),
+    ("artist", "artist"),
+    ("album", "album"),
+    ("track_number", "tracknumber"),
+    ("year", "date"),
+    ("genre", "genre"),
+)
+
+# ID3 frames backing each text field (the same frames EasyID3 maps its keys to)
+_ID3_TEXT_FRAMES = (
+    ("title", "TIT2"),
+    ("artist", "TPE1"),
+    ("album", "TALB"),
+    ("track_number", "TRCK"),
+    ("year", "TDRC"),
+    ("genre", "TCON"),
+)
+
+
+def _get_first_id3_text(id3, frame_id: str) -> str:
+    """Get the first text value of an ID3 frame"""
+    frame = id3.get(frame_id)
+    if frame is None:
+        return ""
+    # TCON holds ID3v1 genre references such as "(17)"; genres resolves them
+    values = frame.genres if frame_id == "TCON" else frame.text
+    if values:
+        return _as_str(values[0])
+    return ""
+
+
+def _read_easy_tags(audio, metadata: TrackMetadata) -> None:
+    """Read text fields from easy-style tags"""
+    for attr, key in _EASY_TEXT_KEYS:
+        setattr(metadata, attr, _get_first_value(audio, key))
+
+
+def _write_easy_tags(audio, metadata: TrackMetadata) -> None:
+    """Write text fields to easy-style tags"""
+    for attr, key in _EASY_TEXT_KEYS:
+        audio[key] = getattr(metadata, attr)
+
+
+def _read_mp3(file_path: Path, metadata: TrackMetadata) -> None:
+    """Read metadata from an MP3 file"""
+    from mutagen.mp3 import MP3
+
+    # Load the ID3 tag once and read both text frames and APIC from it
+    id3 = MP3(file_path).tags
+    if id3 is None:
+        return
+
+    for attr, frame_id in _ID3_TEXT_FRAMES:
+        setattr(metadata, attr, _get_first_id3_text(id3, frame_id))
+
+    # Read cover image from ID3 tags
+    apic_frames = id3.getall("APIC")
+    if apic_frames:
+        apic = apic_frames[0]
+        metadata.cover_image = apic.data
+        metadata.cover_mime = apic.mime
+
+
+def _read_m4a(file_path: Path, metadata: TrackMetadata) -> None:
+    """Read metadata from an M4A file"""
+    from mutagen.easymp4 import EasyMP4
+    from mutagen.mp4 import MP4, MP4Cover
+
+    audio = EasyMP4(file_path)
+    _read_easy_tags(audio, metadata)
+
+    # Read cover image from MP4 tags
+    mp4 = MP4(file_path)
+    covers = mp4.tags.get("covr", []) if mp4.tags else []
+    if covers:
+        cover = covers[0]
+        # MP4Cover is a bytes subclass, so keep it as is instead of copying it
+        metadata.cover_image = cover
+        if cover.imageformat == MP4Cover.FORMAT_PNG:
+            metadata.cover_mime = "image/png"
+        else:
+            metadata.cover_mime = "image/jpeg"
+
+
+def _read_flac(file_path: Path, metadata: TrackMetadata) -> None:
+    """Read metadata from a FLAC file"""
+    from mutagen.flac import FLAC
+
+    audio = FLAC(file_path)
+    _read_easy_tags(audio, metadata)
+
+    # Read cover image from FLAC pictures
+    if audio.pictures:
+        pic = audio.pictures[0]
+        metadata.cover_image = pic.data
+        metadata.cover_mime = pic.mime
+
+
+_READERS = {
+    ".mp3": _read_mp3,
+    ".m4a": _read_m4a,
+    ".flac": _read_flac,
+}
+
+
 def read_metadata(file_path: Path) -> TrackMetadata:
     """Read metadata from a file"""
-    suffix = file_path.suffix.lower()
     metadata = TrackMetadata(file_path=file_path)
-
-    if suffix == ".mp3":
-        try:
-            audio = MP3(file_path, ID3=EasyID3)
-        except ID3NoHeaderError:
-            audio = MP3(file_path)
-            audio.add_tags(ID3=EasyID3)
-            return metadata
-
-        metadata.title = _get_first_value(audio, "title")
-        metadata.artist = _get_first_value(audio, "artist")
-        metadata.album = _get_first_value(audio, "album")
-        metadata.track_number = _get_first_value(audio, "tracknumber")
-        metadata.year = _get_first_value(audio, "date")
-        metadata.genre = _get_first_value(audio, "genre")
-
-        # Read cover image from ID3 tags
-        try:
-            id3 = ID3(file_path)
-            for key in id3.keys():
-                if key.startswith("APIC"):
-                    apic = id3[key]
-                    metadata.cover_image = apic.data
-                    metadata.cover_mime = apic.mime
-                    break
-        except ID3NoHeaderError:
-            pass
-
-    elif suffix == ".m4a":
-        audio = EasyMP4(file_path)
-        metadata.title = _get_first_value(audio, "title")
-        metadata.artist = _get_first_value(audio, "artist")
-        metadata.album = _get_first_value(audio, "album")
-        metadata.track_number = _get_first_value(audio, "tracknumber")
-        metadata.year = _get_first_value(audio, "date")
-        metadata.genre = _get_first_value(audio, "genre")
-
-        # Read cover image from MP4 tags
-        mp4 = MP4(file_path)
-        covers = mp4.tags.get("covr", []) if mp4.tags else []
-        if covers:
-            cover = covers[0]
-            metadata.cover_image = bytes(cover)
-            if cover.imageformat == MP4Cover.FORMAT_PNG:
-                metadata.cover_mime = "image/png"
-            else:
-                metadata.cover_mime = "image/jpeg"
-
-    elif suffix == ".flac":
-        audio = FLAC(file_path)
-        metadata.title = _get_first_value(audio, "title")
-        metadata.artist = _get_first_value(audio, "artist")
-        metadata.album = _get_first_value(audio, "album")
-        metadata.track_number = _get_first_value(audio, "tracknumber")
-        metadata.year = _get_first_value(audio, "date")
-        metadata.genre = _get_first_value(audio, "genre")
-
-        # Read cover image from FLAC pictures
-        if audio.pictures:
-            pic = audio.pictures[0]
-            metadata.cover_image = pic.data
-            metadata.cover_mime = pic.mime
-
+    reader = _READERS.get(file_path.suffix.lower())
+    if reader is not None:
+        reader(file_path, metadata)
     return metadata
 
 
-def write_metadata(metadata: TrackMetadata) -> None:
-    """Write metadata to a file"""
-    file_path = metadata.file_path
-    suffix = file_path.suffix.lower()
+def _write_mp3(metadata: TrackMetadata) -> None:
+    """Write metadata to an MP3 file"""
+    from mutagen.id3 import APIC, Frames
+    from mutagen.mp3 import MP3
 
-    if suffix == ".mp3":
-        try:
-            audio = MP3(file_path, ID3=EasyID3)
-        except ID3NoHeaderError:
-            audio = MP3(file_path)
-            audio.add_tags(ID3=EasyID3)
-            audio = MP3(file_path, ID3=EasyID3)
-
-        audio["title"] = metadata.title
-        audio["artist"] = metadata.artist
-        audio["album"] = metadata.album
-        audio["tracknumber"] = metadata.track_number
-        audio["date"] = metadata.year
-        audio["genre"] = metadata.genre
-        audio.save()
-
-        # Write cover image to ID3 tags
-        try:
-            id3 = ID3(file_path)
-        except ID3NoHeaderError:
-            id3 = ID3()
-            id3.save(file_path)
-            id3 = ID3(file_path)
+    # Update text frames and APIC on a single ID3 tag and save it once
+    audio = MP3(metadata.file_path)
+    if audio.tags is None:
+        audio.add_tags()
+    id3 = audio.tags
+
+    for attr, frame_id in _ID3_TEXT_FRAMES:
+        id3.add(Frames[frame_id](encoding=3, text=[getattr(metadata, attr)]))
 
+    if metadata.cover_dirty:
         # Remove existing APIC frames
-        for key in list(id3.keys()):
-            if key.startswith("APIC"):
-                del id3[key]
+        id3.delall("APIC")
 
         if metadata.cover_image:
             id3.add(
@@ -168,40 +231,44 @@ def write_metadata(metadata: TrackMetadata) -> None:
                     data=metadata.cover_image,
                 )
             )
-        id3.save(file_path)
-
-    elif suffix == ".m4a":
-        audio = EasyMP4(file_path)
-        audio["title"] = metadata.title
-        audio["artist"] = metadata.artist
-        audio["album"] = metadata.album
-        audio["tracknumber"] = metadata.track_number
-        audio["date"] = metadata.year
-        audio["genre"] = metadata.genre
-        audio.save()
-
-        # Write cover image to MP4 tags
-        mp4 = MP4(file_path)
-        if metadata.cover_image:
-            if metadata.cover_mime == "image/png":
-                fmt = MP4Cover.FORMAT_PNG
-            else:
-                fmt = MP4Cover.FORMAT_JPEG
-            mp4["covr"] = [MP4Cover(metadata.cover_image, imageformat=fmt)]
+    audio.save()
+
+
+def _write_m4a(metadata: TrackMetadata) -> None:
+    """Write metadata to an M4A file"""
+    from mutagen.easymp4 import EasyMP4
+    from mutagen.mp4 import MP4, MP4Cover
+
+    file_path = metadata.file_path
+    audio = EasyMP4(file_path)
+    _write_easy_tags(audio, metadata)
+    audio.save()
+
+    if not metadata.cover_dirty:
+        return
+
+    # Write cover image to MP4 tags
+    mp4 = MP4(file_path)
+    if metadata.cover_image:
+        if metadata.cover_mime == "image/png":
+            fmt = MP4Cover.FORMAT_PNG
         else:
-            if "covr" in mp4:
-                del mp4["covr"]
-        mp4.save()
-
-    elif suffix == ".flac":
-        audio = FLAC(file_path)
-        audio["title"] = metadata.title
-        audio["artist"] = metadata.artist
-        audio["album"] = metadata.album
-        audio["tracknumber"] = metadata.track_number
-        audio["date"] = metadata.year
-        audio["genre"] = metadata.genre
+            fmt = MP4Cover.FORMAT_JPEG
+        mp4["covr"] = [MP4Cover(metadata.cover_image, imageformat=fmt)]
+    else:
+        if "covr" in mp4:
+            del mp4["covr"]
+    mp4.save()
+
+
+def _write_flac(metadata: TrackMetadata) -> None:
+    """Write metadata to a FLAC file"""
+    from mutagen.flac import FLAC, Picture
 
+    audio = FLAC(metadata.file_path)
+    _write_easy_tags(audio, metadata)
+
+    if metadata.cover_dirty:
         # Clear existing pictures and add new one
         audio.clear_pictures()
         if metadata.cover_image:
@@ -211,6 +278,21 @@ def write_metadata(metadata: TrackMetadata) -> None:
             pic.desc = "Cover"
             pic.data = metadata.cover_image
             audio.add_picture(pic)
-        audio.save()
+    audio.save()
+
+
+_WRITERS = {
+    ".mp3": _write_mp3,
+    ".m4a": _write_m4a,
+    ".flac": _write_flac,
+}
+
+
+def write_metadata(metadata: TrackMetadata) -> None:
+    """Write metadata to a file"""
+    writer = _WRITERS.get(metadata.file_path.suffix.lower())
+    if writer is not None:
+        writer(metadata)
 
     metadata.modified = False
+    metadata.cover_dirty = False
@@ -1,10 +1,24 @@
 """Metadata table model inheriting QAbstractTableModel"""
 
+import copy
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from hashlib import blake2b
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QImage, QPixmap, QPixmapCache
 
 from .metadata import TrackMetadata
 
@@ -12,6 +26,51 @@ from .metadata import TrackMetadata
 COVER_COLUMN = 0
 FILENAME_COLUMN = 1
 
+# Background color of modified rows
+_MODIFIED_BG = QColor(255, 255, 200)
+
+# Roles answered by data(); Qt also asks for tooltips, fonts, size hints, etc.
+_HANDLED_ROLES = frozenset(
+    int(role)
+    for role in (
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.EditRole,
+        Qt.ItemDataRole.DecorationRole,
+        Qt.ItemDataRole.BackgroundRole,
+        Qt.ItemDataRole.UserRole,
+    )
+)
+
+# Keep cover thumbnails resident in the pixmap cache (limit in KiB)
+QPixmapCache.setCacheLimit(10240)
+
+
+class _ThumbnailSignals(QObject):
+    """Signals of a thumbnail job (QRunnable itself is not a QObject)"""
+
+    # (cover key, thumbnail image)
+    finished = pyqtSignal(str, QImage)
+
+
+class _ThumbnailJob(QRunnable):
+    """Thread pool job that decodes a cover image into a thumbnail"""
+
+    def __init__(self, key: str, image_data: bytes, make_thumbnail: Callable[[bytes], QImage]):
+        super().__init__()
+        # The job never touches the model; results are delivered through signals
+        self.signals = _ThumbnailSignals()
+        self._key = key
+        self._image_data = image_data
+        self._make_thumbnail = make_thumbnail
+
+    def run(self) -> None:
+        image = self._make_thumbnail(self._image_data)
+        try:
+            self.signals.finished.emit(self._key, image)
+        except RuntimeError:
+            # The signals object was destroyed, e.g. while the application quits
+            pass
+
 
 class MetadataTableModel(QAbstractTableModel):
     """Table model for displaying and editing music metadata"""
@@ -27,13 +86,43 @@ class MetadataTableModel(QAbstractTableModel):
         ("Genre", "genre"),
     ]
 
+    # Per-column lookup tables derived from COLUMNS, indexed by column
+    _HEADERS = tuple(header for header, _ in COLUMNS)
+    _ATTRS = tuple(attr_name for _, attr_name in COLUMNS)
+    # Cover and Filename are not text-editable
+    _EDITABLE = tuple(attr_name not in ("file_name", "cover_image") for attr_name in _ATTRS)
+    # DisplayRole/EditRole value getters
+    _GETTERS = tuple(attrgetter(attr_name) for attr_name in _ATTRS)
+
     # Cover display size (width x height)
     COVER_WIDTH = 48
     COVER_HEIGHT = 20
+    COVER_ASPECT = COVER_WIDTH / COVER_HEIGHT
+
+    # Number of rows exposed to the view per fetchMore()
+    FETCH_CHUNK = 200
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Cover keys being decoded on the thread pool, mapped to the rows that
+        # asked for them so only those cells are repainted
+        self._pending_thumbnails: dict[str, set[int]] = {}
+        # Cleared while the view hides the cover column, so nothing is decoded
+        self._cover_enabled = True
         self._tracks: list[TrackMetadata] = []
+        # Added tracks not exposed as rows yet; the view pulls them in via fetchMore()
+        self._pending: deque[TrackMetadata] = deque()
+        # File paths of all tracks for O(1) has_file() lookups
+        self._paths: set[Path] = set()
+        # Snapshots of the tracks as loaded (or last saved), keyed by file path
+        self._originals: dict[Path, TrackMetadata] = {}
+        # Rows of modified tracks, so saving does not have to scan every track
+        self._modified_rows: set[int] = set()
+        # Between begin_bulk_edit() and end_bulk_edit(), setData() only records
+        # the (row, col) cells it changed instead of emitting dataChanged.
+        # A depth counter, so bulk edits can be nested
+        self._bulk_depth = 0
+        self._bulk_touched: set[tuple[int, int]] = set()
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
@@ -51,11 +140,13 @@ class MetadataTableModel(QAbstractTableModel):
         if role != Qt.ItemDataRole.DisplayRole:
             return None
         if orientation == Qt.Orientation.Horizontal:
-            if 0 <= section < len(self.COLUMNS):
-                return self.tr(self.COLUMNS[section][0])
+            if 0 <= section < len(self._HEADERS):
+                return self.tr(self._HEADERS[section])
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role not in _HANDLED_ROLES:
+            return None
         if not index.isValid():
             return None
 
@@ -68,13 +159,12 @@ class MetadataTableModel(QAbstractTableModel):
             return None
 
         track = self._tracks[row]
-        attr_name = self.COLUMNS[col][1]
 
         # Cover image column - special handling
-        if attr_name == "cover_image":
+        if col == COVER_COLUMN:
             if role == Qt.ItemDataRole.DecorationRole:
-                if track.cover_image:
-                    return self._get_cover_pixmap(track.cover_image)
+                if self._cover_enabled and track.cover_image:
+                    return self._get_cover_pixmap(track, row)
                 return None
             if role == Qt.ItemDataRole.UserRole:
                 # Return raw image data for copy/paste
@@ -83,30 +173,82 @@ class MetadataTableModel(QAbstractTableModel):
                 return ""
             if role == Qt.ItemDataRole.BackgroundRole:
                 if track.modified:
-                    from PyQt6.QtGui import QColor
-                    return QColor(255, 255, 200)
+                    return _MODIFIED_BG
             return None
 
         if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-            if attr_name == "file_name":
-                return track.file_path.name
-            return getattr(track, attr_name, "")
+            return self._GETTERS[col](track)
 
         if role == Qt.ItemDataRole.BackgroundRole:
             if track.modified:
-                from PyQt6.QtGui import QColor
-                return QColor(255, 255, 200)
+                return _MODIFIED_BG
 
         return None
 
-    def _get_cover_pixmap(self, image_data: bytes) -> QPixmap:
-        """Convert image data to center-cropped horizontal strip QPixmap"""
+    def display_text(self, row: int, col: int) -> str:
+        """Return the text shown in a cell, without going through QModelIndex"""
+        if col == COVER_COLUMN:
+            return ""
+        return str(self._GETTERS[col](self._tracks[row]))
+
+    def _get_cover_pixmap(self, track: TrackMetadata, row: int) -> QPixmap | None:
+        """Return the cached cover thumbnail of a track
+
+        On a cache miss the thumbnail is decoded on the thread pool and None is
+        returned; the cell is refreshed once the thumbnail is ready.
+        """
+        key = track.cover_key
+        if key is None:
+            digest = blake2b(track.cover_image, digest_size=16).hexdigest()
+            key = track.cover_key = f"cover:{digest}"
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            self._start_thumbnail_job(key, track.cover_image, row)
+        return pixmap
+
+    def _start_thumbnail_job(self, key: str, image_data: bytes, row: int) -> None:
+        """Decode a thumbnail on the thread pool unless it is cached or in progress"""
+        rows = self._pending_thumbnails.get(key)
+        if rows is not None:
+            rows.add(row)
+            return
+        if QPixmapCache.find(key) is not None:
+            return
+        self._pending_thumbnails[key] = {row}
+        job = _ThumbnailJob(key, image_data, self._make_cover_thumbnail)
+        # Queued to the GUI thread, since the signals object lives there
+        job.signals.finished.connect(self._on_thumbnail_ready)
+        QThreadPool.globalInstance().start(job)
+
+    def set_cover_enabled(self, enabled: bool) -> None:
+        """Enable or disable cover thumbnails (disabled while the column is hidden)"""
+        self._cover_enabled = enabled
+
+    def _on_thumbnail_ready(self, key: str, image: QImage) -> None:
+        """Cache a thumbnail decoded by a worker and repaint the cells showing it"""
+        rows = self._pending_thumbnails.pop(key, ())
+        # QPixmap may only be created on the GUI thread
+        QPixmapCache.insert(key, QPixmap.fromImage(image))
+        row_count = len(self._tracks)
+        for row in sorted(rows):
+            # Rows may have been removed while the thumbnail was decoded
+            if row < row_count:
+                index = self.index(row, COVER_COLUMN)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    @classmethod
+    def _make_cover_thumbnail(cls, image_data: bytes) -> QImage:
+        """Convert image data to center-cropped horizontal strip QImage
+
+        Runs on worker threads, so it must only use QImage, not QPixmap.
+        """
         image = QImage()
         if not image.loadFromData(image_data):
-            return QPixmap()
+            return QImage()
 
-        # Calculate crop dimensions to match display aspect ratio
-        target_ratio = self.COVER_WIDTH / self.COVER_HEIGHT
+        # Crop dimensions match the display aspect ratio
+        target_ratio = cls.COVER_ASPECT
         img_w, img_h = image.width(), image.height()
 
         # Crop a horizontal strip from the center
@@ -122,12 +264,12 @@ class MetadataTableModel(QAbstractTableModel):
 
         # Scale to display size
         scaled = cropped.scaled(
-            self.COVER_WIDTH,
-            self.COVER_HEIGHT,
+            cls.COVER_WIDTH,
+            cls.COVER_HEIGHT,
             Qt.AspectRatioMode.IgnoreAspectRatio,
             Qt.TransformationMode.SmoothTransformation,
         )
-        return QPixmap.fromImage(scaled)
+        return scaled
 
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
         if not index.isValid():
@@ -141,7 +283,7 @@ class MetadataTableModel(QAbstractTableModel):
         if col < 0 or col >= len(self.COLUMNS):
             return False
 
-        attr_name = self.COLUMNS[col][1]
+        attr_name = self._ATTRS[col]
         if attr_name == "file_name":
             return False
 
@@ -155,8 +297,11 @@ class MetadataTableModel(QAbstractTableModel):
                     image_data, mime = value
                     track.cover_image = image_data
                     track.cover_mime = mime if mime else "image/jpeg"
+                    track.cover_key = None
+                    track.cover_dirty = True
                     track.modified = True
-                    self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+                    self._modified_rows.add(row)
+                    self._emit_cell_changed(index, [Qt.ItemDataRole.DecorationRole])
                     return True
             return False
 
@@ -167,67 +312,218 @@ class MetadataTableModel(QAbstractTableModel):
         old_value = getattr(track, attr_name, "")
 
         if old_value != value:
-            setattr(track, attr_name, str(value))
+            # Editors and paste already pass str; avoid copying it
+            setattr(track, attr_name, value if type(value) is str else str(value))
             track.modified = True
-            self.dataChanged.emit(index, index, [role])
+            self._modified_rows.add(row)
+            self._emit_cell_changed(index, [role])
             return True
 
         return False
 
+    def _emit_cell_changed(self, index: QModelIndex, roles: list[int]) -> None:
+        """Emit dataChanged for one cell, or defer it during a bulk edit"""
+        if self._bulk_depth:
+            self._bulk_touched.add((index.row(), index.column()))
+        else:
+            self.dataChanged.emit(index, index, roles)
+
+    @contextmanager
+    def bulk_edit(self) -> Iterator[None]:
+        """Context manager pairing begin_bulk_edit() with end_bulk_edit(), even on errors"""
+        self.begin_bulk_edit()
+        try:
+            yield
+        finally:
+            self.end_bulk_edit()
+
+    def begin_bulk_edit(self) -> None:
+        """Start collecting setData() changes instead of emitting them per cell"""
+        self._bulk_depth += 1
+
+    def end_bulk_edit(self) -> None:
+        """Emit one dataChanged per column covering the cells changed since begin_bulk_edit()
+
+        Nested bulk edits emit only when the outermost one ends.
+        """
+        # An unmatched call must not leave the model muted
+        if self._bulk_depth == 0:
+            return
+        self._bulk_depth -= 1
+        if self._bulk_depth:
+            return
+        touched, self._bulk_touched = self._bulk_touched, set()
+
+        bounds: dict[int, tuple[int, int]] = {}
+        for row, col in touched:
+            top, bottom = bounds.get(col, (row, row))
+            bounds[col] = (min(top, row), max(bottom, row))
+
+        for col, (top, bottom) in sorted(bounds.items()):
+            roles = (
+                [Qt.ItemDataRole.DecorationRole]
+                if col == COVER_COLUMN
+                else [Qt.ItemDataRole.EditRole]
+            )
+            roles.append(Qt.ItemDataRole.BackgroundRole)
+            self.dataChanged.emit(self.index(top, col), self.index(bottom, col), roles)
+
+    def set_data_bulk(self, rows: list[int], col: int, value: str) -> bool:
+        """Set the same text value in one column of several rows
+
+        Emits a single dataChanged over the changed rows instead of one per cell.
+        """
+        if col < 0 or col >= len(self.COLUMNS):
+            return False
+
+        if not self._EDITABLE[col]:
+            return False
+
+        attr_name = self._ATTRS[col]
+
+        changed = []
+        for row in rows:
+            if row < 0 or row >= len(self._tracks):
+                continue
+            track = self._tracks[row]
+            if getattr(track, attr_name) != value:
+                setattr(track, attr_name, value)
+                track.modified = True
+                changed.append(row)
+
+        if not changed:
+            return False
+
+        self._modified_rows.update(changed)
+        self.dataChanged.emit(
+            self.index(min(changed), col),
+            self.index(max(changed), col),
+            [Qt.ItemDataRole.EditRole, Qt.ItemDataRole.BackgroundRole],
+        )
+        return True
+
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
         if not index.isValid():
             return Qt.ItemFlag.NoItemFlags
 
         flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
 
-        col = index.column()
-        attr_name = self.COLUMNS[col][1]
-        # Cover and Filename are not text-editable
-        if attr_name not in ("file_name", "cover_image"):
+        if self._EDITABLE[index.column()]:
             flags |= Qt.ItemFlag.ItemIsEditable
 
         return flags
 
-    def add_tracks(self, tracks: list[TrackMetadata]) -> None:
-        """Add tracks"""
+    def editable_columns(self) -> tuple[int, ...]:
+        """Return the indices of the text-editable columns in order"""
+        return tuple(col for col, editable in enumerate(self._EDITABLE) if editable)
+
+    def non_text_editable_columns(self) -> frozenset[int]:
+        """Return the indices of the columns that do not accept text (Cover, Filename)"""
+        return frozenset(col for col, editable in enumerate(self._EDITABLE) if not editable)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return bool(self._pending)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        self._insert_pending(self.FETCH_CHUNK)
+
+    def _insert_pending(self, count: int) -> None:
+        """Expose up to count pending tracks as rows"""
+        tracks = [self._pending.popleft() for _ in range(min(count, len(self._pending)))]
         if not tracks:
             return
         begin = len(self._tracks)
         end = begin + len(tracks) - 1
         self.beginInsertRows(QModelIndex(), begin, end)
         self._tracks.extend(tracks)
+        self._modified_rows.update(row for row, t in enumerate(tracks, begin) if t.modified)
         self.endInsertRows()
 
+    def fetch_all(self) -> None:
+        """Expose all pending tracks as rows (before edits that span every track)"""
+        self._insert_pending(len(self._pending))
+
+    def add_tracks(self, tracks: list[TrackMetadata]) -> None:
+        """Add tracks
+
+        Only the first FETCH_CHUNK tracks become rows right away; the rest are
+        inserted in chunks as the view scrolls down.
+        """
+        if not tracks:
+            return
+        self._paths.update(t.file_path for t in tracks)
+        self._originals.update((t.file_path, copy.copy(t)) for t in tracks)
+        self._pending.extend(tracks)
+        self._insert_pending(self.FETCH_CHUNK)
+
+    def add_unique(self, tracks: list[TrackMetadata]) -> list[TrackMetadata]:
+        """Add tracks whose files are not in the model yet and return them"""
+        unique = []
+        seen: set[Path] = set()
+        for track in tracks:
+            if track.file_path not in self._paths and track.file_path not in seen:
+                seen.add(track.file_path)
+                unique.append(track)
+        self.add_tracks(unique)
+        return unique
+
     def add_track(self, track: TrackMetadata) -> None:
         """Add a single track"""
         self.add_tracks([track])
 
     def clear(self) -> None:
         """Clear all tracks"""
+        self._pending.clear()
+        self._paths.clear()
+        self._originals.clear()
+        # Jobs in flight still cache their thumbnails, but have no rows to repaint
+        for rows in self._pending_thumbnails.values():
+            rows.clear()
         if not self._tracks:
             return
         self.beginRemoveRows(QModelIndex(), 0, len(self._tracks) - 1)
         self._tracks.clear()
+        self._modified_rows.clear()
         self.endRemoveRows()
 
     def get_modified_tracks(self) -> list[TrackMetadata]:
         """Return list of modified tracks"""
-        return [t for t in self._tracks if t.modified]
+        return [self._tracks[row] for row in sorted(self._modified_rows)]
 
     def get_all_tracks(self) -> list[TrackMetadata]:
-        """Return all tracks"""
-        return self._tracks.copy()
+        """Return all tracks, including those not fetched into rows yet"""
+        return [*self._tracks, *self._pending]
 
     def has_file(self, file_path: Path) -> bool:
         """Check if the specified file has already been added"""
-        return any(t.file_path == file_path for t in self._tracks)
-
-    def mark_all_saved(self) -> None:
-        """Clear the modified flag of all tracks"""
-        for track in self._tracks:
+        return file_path in self._paths
+
+    def original_for(self, track: TrackMetadata) -> TrackMetadata | None:
+        """Return the snapshot of the track as loaded or last saved"""
+        return self._originals.get(track.file_path)
+
+    def mark_all_saved(self, saved: list[TrackMetadata] | None = None) -> None:
+        """Clear the modified flag of all tracks, or only of the saved ones
+
+        Tracks that are not in saved (e.g. because writing them failed) stay
+        modified, keep their snapshot and are retried by the next save.
+        """
+        saved_ids = None if saved is None else {id(track) for track in saved}
+        last_col = len(self.COLUMNS) - 1
+        for row in sorted(self._modified_rows):
+            track = self._tracks[row]
+            if saved_ids is not None and id(track) not in saved_ids:
+                continue
+            self._modified_rows.discard(row)
             track.modified = False
-        if self._tracks:
+            self._originals[track.file_path] = copy.copy(track)
+            # Only the highlight of the saved rows changes
             self.dataChanged.emit(
-                self.index(0, 0),
-                self.index(len(self._tracks) - 1, len(self.COLUMNS) - 1),
+                self.index(row, 0),
+                self.index(row, last_col),
+                [Qt.ItemDataRole.BackgroundRole],
             )
@@ -1,26 +1,163 @@
 """Custom QTableView with Excel-like keyboard navigation"""
 
+import os
 from io import BytesIO
-from pathlib import Path
-
-from PyQt6.QtCore import QBuffer, QIODevice, QItemSelection, QItemSelectionModel, Qt
+from itertools import starmap
+from operator import itemgetter
+
+from PyQt6.QtCore import (
+    QBuffer,
+    QByteArray,
+    QEvent,
+    QIODevice,
+    QItemSelection,
+    QItemSelectionModel,
+    QMimeData,
+    QObject,
+    QPersistentModelIndex,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QGuiApplication, QImage
 from PyQt6.QtWidgets import QAbstractItemDelegate, QAbstractItemView, QTableView
 
-from .tablemodel import COVER_COLUMN, FILENAME_COLUMN
+from .tablemodel import COVER_COLUMN
+
+# Qt enum values used on the key press path, resolved once at import
+_K_UP = Qt.Key.Key_Up
+_K_DOWN = Qt.Key.Key_Down
+_K_LEFT = Qt.Key.Key_Left
+_K_RIGHT = Qt.Key.Key_Right
+_K_TAB = Qt.Key.Key_Tab
+_K_BACKTAB = Qt.Key.Key_Backtab
+_K_RETURN = Qt.Key.Key_Return
+_K_ENTER = Qt.Key.Key_Enter
+_K_DELETE = Qt.Key.Key_Delete
+_K_BACKSPACE = Qt.Key.Key_Backspace
+_K_C = Qt.Key.Key_C
+_K_V = Qt.Key.Key_V
+_ARROW_KEYS = (_K_UP, _K_DOWN, _K_LEFT, _K_RIGHT)
+_MOD_CTRL = Qt.KeyboardModifier.ControlModifier
+_MOD_SHIFT = Qt.KeyboardModifier.ShiftModifier
+_ROLE_EDIT = Qt.ItemDataRole.EditRole
+_ROLE_USER = Qt.ItemDataRole.UserRole
+_STATE_EDITING = QAbstractItemView.State.EditingState
+_HINT_NONE = QAbstractItemDelegate.EndEditHint.NoHint
+
+# Qt image format names of the cover MIME types, used as decoder hints
+_IMAGE_FORMATS = {"image/png": "PNG", "image/jpeg": "JPG"}
+
+# MIME types of the image file extensions accepted as covers by drag and drop
+_IMG_MIME = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
+
+
+def _image_mime(file_name: str) -> str | None:
+    """Return the MIME type of an image file name, or None for other files"""
+    # Plain string slicing; no Path object per dragged URL
+    dot = file_name.rfind(".")
+    if dot < 0:
+        return None
+    return _IMG_MIME.get(file_name[dot:].lower())
+
+
+def _read_image_bytes(file_name: str) -> bytes:
+    """Read a whole image file with a single read sized from fstat()"""
+    with open(file_name, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # read(-1) also covers files whose size cannot be known up front
+        return f.read(size or -1)
+
+
+class _CoverMimeData(QMimeData):
+    """Clipboard data of a cover: the stored bytes plus a lazily decoded image
+
+    The bytes are offered under their own MIME type, so pasting a PNG cover
+    within the editor neither decodes nor re-encodes it. Other applications
+    (e.g. on Windows and macOS) need a native bitmap, which Qt builds from the
+    image; it is only decoded once a consumer actually asks for it.
+    """
+
+    _IMAGE_MIME = "application/x-qt-image"
+
+    def __init__(self, image_data: bytes, mime: str):
+        super().__init__()
+        self._image_data = image_data
+        self._mime = mime
+        self._image: QImage | None = None
+        self.setData(mime, QByteArray(image_data))
+
+    def formats(self) -> list[str]:
+        return [*super().formats(), self._IMAGE_MIME]
+
+    def hasFormat(self, mime_type: str) -> bool:
+        return mime_type == self._IMAGE_MIME or super().hasFormat(mime_type)
+
+    def retrieveData(self, mime_type: str, preferred_type):
+        if mime_type != self._IMAGE_MIME:
+            return super().retrieveData(mime_type, preferred_type)
+        if self._image is None:
+            # Decode with the plugin matching the MIME type and only fall back
+            # to format detection if the data does not match it
+            image = QImage.fromData(self._image_data, _IMAGE_FORMATS.get(self._mime))
+            if image.isNull():
+                image = QImage.fromData(self._image_data)
+            self._image = image
+        return None if self._image.isNull() else self._image
+
+
+class _ImageLoadSignals(QObject):
+    """Signals of an image load job (QRunnable itself is not a QObject)"""
+
+    # (target QPersistentModelIndex, image data, MIME type)
+    loaded = pyqtSignal(object, bytes, str)
+
+
+class _ImageLoadJob(QRunnable):
+    """Thread pool job that reads a dropped image file"""
+
+    def __init__(self, target: QPersistentModelIndex, candidates: list[tuple[str, str]]):
+        super().__init__()
+        self.signals = _ImageLoadSignals()
+        self._target = target
+        # (file name, MIME type) pairs; the first readable file is used
+        self._candidates = candidates
+
+    def run(self) -> None:
+        for file_name, mime in self._candidates:
+            try:
+                image_data = _read_image_bytes(file_name)
+            except OSError:
+                continue
+            try:
+                self.signals.loaded.emit(self._target, image_data, mime)
+            except RuntimeError:
+                # The signals object was destroyed, e.g. while the application quits
+                pass
+            return
 
 
 class SingleColumnSelectionModel(QItemSelectionModel):
     """Selection model that restricts selection to a single column"""
 
+    # Selection flags used on every select() call
+    _NO_UPDATE = QItemSelectionModel.SelectionFlag.NoUpdate
+    _CLEAR = QItemSelectionModel.SelectionFlag.Clear
+    _CLEAR_AND_SELECT = QItemSelectionModel.SelectionFlag.ClearAndSelect
+
     def __init__(self, model=None, parent=None):
         super().__init__(model, parent)
         self._active_column = None
 
     def select(self, selection, command):
         """Override to restrict selection to a single column"""
+        # QItemSelectionModel ignores NoUpdate as well; skip the column bookkeeping
+        if command == self._NO_UPDATE:
+            return
+
         # Reset active column on Clear
-        if command & QItemSelectionModel.SelectionFlag.Clear:
+        if command & self._CLEAR:
             self._active_column = None
 
         # Determine which column we're trying to select
@@ -28,12 +165,8 @@ class SingleColumnSelectionModel(QItemSelectionModel):
             if selection.isEmpty():
                 super().select(selection, command)
                 return
-            # Get the first index from the selection
-            indexes = selection.indexes()
-            if not indexes:
-                super().select(selection, command)
-                return
-            new_column = indexes[0].column()
+            # Read the column from the first range instead of expanding every index
+            new_column = selection.first().left()
         else:
             # selection is a QModelIndex
             if not selection.isValid():
@@ -46,7 +179,7 @@ class SingleColumnSelectionModel(QItemSelectionModel):
         if self._active_column is not None and new_column != self._active_column:
             self._active_column = new_column
             # Clear existing selection and select the new item
-            super().select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+            super().select(selection, self._CLEAR_AND_SELECT)
             return
 
         # Set or maintain the active column
@@ -59,8 +192,8 @@ class SingleColumnSelectionModel(QItemSelectionModel):
 class NavigableTableView(QTableView):
     """QTableView with Excel-like keyboard navigation"""
 
-    # First editable text column (Title)
-    FIRST_EDITABLE_COLUMN = 2
+    # Cover column index, bound to the class so handlers read it as an attribute
+    COVER_COLUMN = COVER_COLUMN
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -71,6 +204,19 @@ class NavigableTableView(QTableView):
         self.setAcceptDrops(True)
         self.viewport().setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
+        # Whether the current drag carries an image file (set in dragEnterEvent)
+        self._drag_has_image = False
+
+        # Tab/Shift+Tab targets, built from the model's editable columns in setModel()
+        self._editable_cols: tuple[int, ...] = ()
+        # Next/previous editable column in the same row indexed by column,
+        # or -1 to wrap to another row
+        self._next_col: list[int] = []
+        self._prev_col: list[int] = []
+
+        # Clicking a column header selects the column inside Qt, bypassing selectAll(),
+        # so unfetched tracks are pulled in before the press reaches the header
+        self.horizontalHeader().viewport().installEventFilter(self)
 
     def setModel(self, model):
         """Override to apply SingleColumnSelectionModel"""
@@ -78,13 +224,61 @@ class NavigableTableView(QTableView):
         if model is not None:
             selection_model = SingleColumnSelectionModel(model, self)
             self.setSelectionModel(selection_model)
+            self._build_tab_order(model)
+
+    def _build_tab_order(self, model) -> None:
+        """Precompute the Tab/Shift+Tab target of every column"""
+        editable = model.editable_columns()
+        columns = range(model.columnCount())
+        self._editable_cols = editable
+        self._next_col = [next((c for c in editable if c > col), -1) for col in columns]
+        self._prev_col = [next((c for c in reversed(editable) if c < col), -1) for col in columns]
+
+    def setColumnHidden(self, column: int, hide: bool) -> None:
+        """Override to stop decoding covers while the cover column is hidden"""
+        super().setColumnHidden(column, hide)
+        model = self.model()
+        if column == self.COVER_COLUMN and model is not None:
+            model.set_cover_enabled(not hide)
+
+    def hideColumn(self, column: int) -> None:
+        """Override so hiding goes through setColumnHidden()"""
+        self.setColumnHidden(column, True)
+
+    def showColumn(self, column: int) -> None:
+        """Override so showing goes through setColumnHidden()"""
+        self.setColumnHidden(column, False)
+
+    def selectAll(self) -> None:
+        """Override to fetch every track first, so Ctrl+A edits reach all of them"""
+        model = self.model()
+        if model is not None:
+            model.fetch_all()
+        super().selectAll()
+
+    def eventFilter(self, obj, event) -> bool:
+        """Fetch every track before a header click selects a whole column"""
+        if (
+            event.type() == QEvent.Type.MouseButtonPress
+            and obj is self.horizontalHeader().viewport()
+        ):
+            model = self.model()
+            if model is not None:
+                model.fetch_all()
+        return super().eventFilter(obj, event)
 
     def keyPressEvent(self, event) -> None:
         """Handle keyboard navigation"""
         model = self.model()
-        if model is None or model.rowCount() == 0:
+        if model is None:
+            super().keyPressEvent(event)
+            return
+        # Query the counts once per key press and pass them to the helpers
+        row_count = model.rowCount()
+        if row_count == 0:
             super().keyPressEvent(event)
             return
+        col_count = model.columnCount()
 
         current = self.currentIndex()
         if not current.isValid():
@@ -95,176 +289,174 @@ class NavigableTableView(QTableView):
         modifiers = event.modifiers()
 
         # If currently editing, let the editor handle keys
-        if self.state() == QAbstractItemView.State.EditingState:
-            if key in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right):
+        if self.state() == _STATE_EDITING:
+            if key in _ARROW_KEYS:
                 super().keyPressEvent(event)
                 return
             # Let editor handle Ctrl+C/V
-            if key in (Qt.Key.Key_C, Qt.Key.Key_V) and modifiers & Qt.KeyboardModifier.ControlModifier:
+            if key in (_K_C, _K_V) and modifiers & _MOD_CTRL:
                 super().keyPressEvent(event)
                 return
 
         # Handle copy/paste when not editing
-        if modifiers & Qt.KeyboardModifier.ControlModifier:
-            if key == Qt.Key.Key_C:
-                self._copy_selection()
+        if modifiers & _MOD_CTRL:
+            if key == _K_C:
+                self._copy_selection(model)
                 return
-            elif key == Qt.Key.Key_V:
-                self._paste_to_selection()
+            elif key == _K_V:
+                self._paste_to_selection(model)
                 return
 
         # Handle delete key
-        if key in (Qt.Key.Key_Delete, Qt.Key.Key_Backspace):
-            self._delete_selection()
+        if key in (_K_DELETE, _K_BACKSPACE):
+            self._delete_selection(model)
             return
 
-        if key == Qt.Key.Key_Return or key == Qt.Key.Key_Enter:
-            self._handle_enter(current)
-        elif key == Qt.Key.Key_Tab:
-            if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                self._handle_shift_tab(current)
+        if key == _K_RETURN or key == _K_ENTER:
+            self._handle_enter(current, model, row_count, col_count)
+        elif key == _K_TAB:
+            if modifiers & _MOD_SHIFT:
+                self._handle_shift_tab(current, model, row_count, col_count)
             else:
-                self._handle_tab(current)
-        elif key in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right):
-            if modifiers & Qt.KeyboardModifier.ShiftModifier:
+                self._handle_tab(current, model, row_count, col_count)
+        elif key == _K_BACKTAB:
+            # Qt reports Shift+Tab as Key_Backtab
+            self._handle_shift_tab(current, model, row_count, col_count)
+        elif key in _ARROW_KEYS:
+            if modifiers & _MOD_SHIFT:
                 # Let Qt handle shift+arrow for range selection
                 super().keyPressEvent(event)
             else:
                 # Custom single-cell navigation
-                if key == Qt.Key.Key_Up:
-                    self._move_to_cell(current.row() - 1, current.column())
-                elif key == Qt.Key.Key_Down:
-                    self._move_to_cell(current.row() + 1, current.column())
-                elif key == Qt.Key.Key_Left:
-                    self._move_to_cell(current.row(), current.column() - 1)
-                elif key == Qt.Key.Key_Right:
-                    self._move_to_cell(current.row(), current.column() + 1)
+                row = current.row()
+                col = current.column()
+                if key == _K_UP:
+                    self._move_to_cell(row - 1, col, model, row_count, col_count)
+                elif key == _K_DOWN:
+                    self._move_to_cell(row + 1, col, model, row_count, col_count)
+                elif key == _K_LEFT:
+                    self._move_to_cell(row, col - 1, model, row_count, col_count)
+                elif key == _K_RIGHT:
+                    self._move_to_cell(row, col + 1, model, row_count, col_count)
         else:
             super().keyPressEvent(event)
 
-    def _handle_enter(self, current) -> None:
+    def _handle_enter(self, current, model, row_count: int, col_count: int) -> None:
         """Handle Enter key: commit edit and move down"""
         # Close any active editor
-        if self.state() == QAbstractItemView.State.EditingState:
-            self.commitData(self.indexWidget(current))
-            self.closeEditor(self.indexWidget(current), QAbstractItemDelegate.EndEditHint.NoHint)
+        if self.state() == _STATE_EDITING:
+            editor = self.indexWidget(current)
+            if editor is not None:
+                self.commitData(editor)
+                self.closeEditor(editor, _HINT_NONE)
 
         # Move to next row (same column)
         next_row = current.row() + 1
-        if next_row < self.model().rowCount():
-            self._move_to_cell(next_row, current.column())
+        if next_row < row_count:
+            self._move_to_cell(next_row, current.column(), model, row_count, col_count)
 
-    def _handle_tab(self, current) -> None:
+    def _handle_tab(self, current, model, row_count: int, col_count: int) -> None:
         """Handle Tab key: move right, skip Cover/Filename columns, wrap to next row"""
-        model = self.model()
         row = current.row()
-        col = current.column()
 
-        # Find next editable text column
-        next_col = col + 1
-        while next_col < model.columnCount():
-            if next_col not in (COVER_COLUMN, FILENAME_COLUMN):
-                self._move_to_cell(row, next_col)
-                return
-            next_col += 1
+        next_col = self._next_col[current.column()]
+        if next_col >= 0:
+            self._move_to_cell(row, next_col, model, row_count, col_count)
+            return
 
         # Reached end of row, move to next row's first editable column
         next_row = row + 1
-        if next_row < model.rowCount():
-            self._move_to_cell(next_row, self.FIRST_EDITABLE_COLUMN)
+        if next_row < row_count and self._editable_cols:
+            self._move_to_cell(next_row, self._editable_cols[0], model, row_count, col_count)
 
-    def _handle_shift_tab(self, current) -> None:
+    def _handle_shift_tab(self, current, model, row_count: int, col_count: int) -> None:
         """Handle Shift+Tab: move left, skip Cover/Filename columns, wrap to previous row"""
-        model = self.model()
         row = current.row()
-        col = current.column()
 
-        # Find previous editable text column
-        prev_col = col - 1
-        while prev_col >= 0:
-            if prev_col not in (COVER_COLUMN, FILENAME_COLUMN):
-                self._move_to_cell(row, prev_col)
-                return
-            prev_col -= 1
-
-        # Reached beginning of row, move to previous row's last column
-        prev_row = row - 1
-        if prev_row >= 0:
-            last_col = model.columnCount() - 1
-            self._move_to_cell(prev_row, last_col)
-
-    def _move_to_cell(self, row: int, col: int) -> None:
-        """Move selection to specified cell if valid"""
-        model = self.model()
-        if model is None:
+        prev_col = self._prev_col[current.column()]
+        if prev_col >= 0:
+            self._move_to_cell(row, prev_col, model, row_count, col_count)
             return
 
-        if row < 0 or row >= model.rowCount():
+        # Reached beginning of row, move to previous row's last editable column
+        prev_row = row - 1
+        if prev_row >= 0 and self._editable_cols:
+            self._move_to_cell(prev_row, self._editable_cols[-1], model, row_count, col_count)
+
+    def _move_to_cell(
+        self,
+        row: int,
+        col: int,
+        model,
+        row_count: int | None = None,
+        col_count: int | None = None,
+    ) -> None:
+        """Move selection to specified cell if valid
+
+        Key handlers pass the model and its counts they already looked up.
+        """
+        # Either index is negative exactly when their bitwise OR is
+        if (row | col) < 0:
             return
-        if col < 0 or col >= model.columnCount():
+        if row_count is None:
+            row_count = model.rowCount()
+        if col_count is None:
+            col_count = model.columnCount()
+        if row >= row_count or col >= col_count:
             return
 
         index = model.index(row, col)
         self.setCurrentIndex(index)
 
-    def _copy_selection(self) -> None:
+    def _copy_selection(self, model) -> None:
         """Copy selected cells' values to clipboard"""
-        indexes = self.selectionModel().selectedIndexes()
-        if not indexes:
+        selection = self.selectionModel().selection()
+        if selection.isEmpty():
             return
 
-        # Sort by row to get consistent order
-        indexes = sorted(indexes, key=lambda idx: idx.row())
+        # Walk the selection ranges instead of materializing every QModelIndex
+        cells = [
+            (row, col)
+            for rng in selection
+            for row in range(rng.top(), rng.bottom() + 1)
+            for col in range(rng.left(), rng.right() + 1)
+        ]
+        # A single range is already in row order; otherwise sort by row
+        # to get consistent order
+        if len(selection) > 1:
+            cells.sort(key=itemgetter(0))
 
         clipboard = QGuiApplication.clipboard()
 
         # If selecting cover column, copy image
-        if indexes[0].column() == COVER_COLUMN:
+        if cells[0][1] == self.COVER_COLUMN:
             # Copy first selected cover image
-            data = indexes[0].data(Qt.ItemDataRole.UserRole)
+            data = model.index(*cells[0]).data(_ROLE_USER)
             if data and data[0]:
-                image_data, _ = data
-                image = QImage()
-                if image.loadFromData(image_data):
-                    clipboard.setImage(image)
+                image_data, mime = data
+                clipboard.setMimeData(_CoverMimeData(image_data, mime))
             return
 
         # Copy text values (newline separated for multiple cells)
-        values = []
-        for index in indexes:
-            value = index.data(Qt.ItemDataRole.DisplayRole)
-            if value is not None:
-                values.append(str(value))
-            else:
-                values.append("")
+        clipboard.setText("\n".join(starmap(model.display_text, cells)))
 
-        clipboard.setText("\n".join(values))
-
-    def _paste_to_selection(self) -> None:
+    def _paste_to_selection(self, model) -> None:
         """Paste clipboard value to all selected cells"""
-        model = self.model()
-        if model is None:
-            return
-
         clipboard = QGuiApplication.clipboard()
         indexes = self.selectionModel().selectedIndexes()
         if not indexes:
             return
+        cover_targets, text_targets = self._partition_targets(model, indexes)
 
         # If pasting to cover column, try to paste image
-        if indexes[0].column() == COVER_COLUMN:
-            image = clipboard.image()
-            if not image.isNull():
-                # Convert image to PNG bytes
-                buffer = QBuffer()
-                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-                image.save(buffer, "PNG")
-                image_data = bytes(buffer.data())
-                buffer.close()
-
-                for index in indexes:
-                    if index.column() == COVER_COLUMN:
-                        model.setData(index, (image_data, "image/png"), Qt.ItemDataRole.UserRole)
+        if indexes[0].column() == self.COVER_COLUMN:
+            image_data = self._clipboard_png(clipboard)
+            if image_data is not None:
+                with model.bulk_edit():
+                    for target in cover_targets:
+                        if target.isValid():
+                            index = model.index(target.row(), target.column())
+                            model.setData(index, (image_data, "image/png"), _ROLE_USER)
             return
 
         # Paste text to other columns
@@ -272,57 +464,108 @@ class NavigableTableView(QTableView):
         if not text:
             return
 
-        # Paste same value to all selected cells (skip cover/filename columns)
-        for index in indexes:
-            if index.column() in (COVER_COLUMN, FILENAME_COLUMN):
-                continue
-            model.setData(index, text, Qt.ItemDataRole.EditRole)
-
-    def _delete_selection(self) -> None:
+        # Paste same value to all selected text cells
+        rows_by_column: dict[int, list[int]] = {}
+        for target in text_targets:
+            if target.isValid():
+                rows_by_column.setdefault(target.column(), []).append(target.row())
+
+        # One bulk update (and one dataChanged) per column
+        for col, rows in rows_by_column.items():
+            model.set_data_bulk(rows, col, text)
+
+    @staticmethod
+    def _clipboard_png(clipboard) -> bytes | None:
+        """Return the clipboard image as PNG bytes, or None if it holds no image"""
+        # Use PNG data as is when the source provides it, skipping a re-encode
+        mime_data = clipboard.mimeData()
+        if mime_data is not None and mime_data.hasFormat("image/png"):
+            return bytes(mime_data.data("image/png"))
+
+        image = clipboard.image()
+        if image.isNull():
+            return None
+
+        # Convert image to PNG bytes
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        image_data = bytes(buffer.data())
+        buffer.close()
+        return image_data
+
+    def _delete_selection(self, model) -> None:
         """Delete selected cells' values"""
-        model = self.model()
-        if model is None:
-            return
-
         indexes = self.selectionModel().selectedIndexes()
         if not indexes:
             return
-
+        cover_targets, text_targets = self._partition_targets(model, indexes)
+
+        # Emit one dataChanged per column instead of one per cell
+        with model.bulk_edit():
+            for target in cover_targets:
+                if target.isValid():
+                    # Delete cover image
+                    index = model.index(target.row(), target.column())
+                    model.setData(index, (None, "image/jpeg"), _ROLE_USER)
+            for target in text_targets:
+                if target.isValid():
+                    # Clear text field
+                    model.setData(model.index(target.row(), target.column()), "", _ROLE_EDIT)
+
+    def _partition_targets(
+        self, model, indexes
+    ) -> tuple[list[QPersistentModelIndex], list[QPersistentModelIndex]]:
+        """Split selected indexes into cover and text cells, skipping read-only columns
+
+        Persistent indexes keep pointing at the right cells while the model is edited.
+        """
+        cover_col = self.COVER_COLUMN
+        skip_cols = model.non_text_editable_columns()
+        cover_targets = []
+        text_targets = []
         for index in indexes:
             col = index.column()
-            if col == FILENAME_COLUMN:
-                continue
-            if col == COVER_COLUMN:
-                # Delete cover image
-                model.setData(index, (None, "image/jpeg"), Qt.ItemDataRole.UserRole)
-            else:
-                # Clear text field
-                model.setData(index, "", Qt.ItemDataRole.EditRole)
+            if col == cover_col:
+                cover_targets.append(QPersistentModelIndex(index))
+            elif col not in skip_cols:
+                text_targets.append(QPersistentModelIndex(index))
+        return cover_targets, text_targets
 
     def dragEnterEvent(self, event) -> None:
         """Handle drag enter for image files"""
+        self._drag_has_image = False
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
             for url in urls:
-                if url.isLocalFile():
-                    path = Path(url.toLocalFile())
-                    if path.suffix.lower() in (".jpg", ".jpeg", ".png"):
-                        event.acceptProposedAction()
-                        return
+                if url.isLocalFile() and _image_mime(url.toLocalFile()) is not None:
+                    self._drag_has_image = True
+                    event.acceptProposedAction()
+                    return
         event.ignore()
 
+    def dragLeaveEvent(self, event) -> None:
+        """Forget the drag state when the drag leaves the view"""
+        self._drag_has_image = False
+        super().dragLeaveEvent(event)
+
     def dragMoveEvent(self, event) -> None:
         """Handle drag move for image files"""
+        # Skip the hit test for drags without image files
+        if not self._drag_has_image:
+            event.ignore()
+            return
         index = self.indexAt(event.position().toPoint())
-        if index.isValid() and index.column() == COVER_COLUMN:
+        if index.isValid() and index.column() == self.COVER_COLUMN:
             event.acceptProposedAction()
         else:
             event.ignore()
 
     def dropEvent(self, event) -> None:
         """Handle drop of image files onto cover column"""
+        self._drag_has_image = False
         index = self.indexAt(event.position().toPoint())
-        if not index.isValid() or index.column() != COVER_COLUMN:
+        if not index.isValid() or index.column() != self.COVER_COLUMN:
             event.ignore()
             return
 
@@ -331,22 +574,29 @@ class NavigableTableView(QTableView):
             event.ignore()
             return
 
-        urls = event.mimeData().urls()
-        for url in urls:
+        candidates = []
+        for url in event.mimeData().urls():
             if url.isLocalFile():
-                path = Path(url.toLocalFile())
-                suffix = path.suffix.lower()
-                if suffix in (".jpg", ".jpeg", ".png"):
-                    try:
-                        image_data = path.read_bytes()
-                        if suffix == ".png":
-                            mime = "image/png"
-                        else:
-                            mime = "image/jpeg"
-                        model.setData(index, (image_data, mime), Qt.ItemDataRole.UserRole)
-                        event.acceptProposedAction()
-                        return
-                    except Exception:
-                        pass
+                file_name = url.toLocalFile()
+                mime = _image_mime(file_name)
+                if mime is not None:
+                    candidates.append((file_name, mime))
 
-        event.ignore()
+        if not candidates:
+            event.ignore()
+            return
+
+        # Read the file on the thread pool; the persistent index follows the row
+        # if rows are inserted or removed before the data arrives
+        job = _ImageLoadJob(QPersistentModelIndex(index), candidates)
+        job.signals.loaded.connect(self._on_image_loaded)
+        QThreadPool.globalInstance().start(job)
+        event.acceptProposedAction()
+
+    def _on_image_loaded(self, target: QPersistentModelIndex, image_data: bytes, mime: str) -> None:
+        """Set a cover image read by an image load job"""
+        model = self.model()
+        if model is None or not target.isValid() or target.model() is not model:
+            return
+        index = model.index(target.row(), target.column())
+        model.setData(index, (image_data, mime), _ROLE_USER)
@@ -3,3 +3,7 @@
 from pathlib import Path
 
 TRANSLATIONS_DIR = Path(__file__).parent
+
+# Compiled Japanese translation (built by `make translations`)
+JA_QM = TRANSLATIONS_DIR / "shoboi_tag_editor_ja.qm"
+JA_QM_EXISTS = JA_QM.is_file()
@@ -39,6 +39,14 @@
         <source>No modified tracks.</source>
         <translation>変更されたトラックはありません。</translation>
     </message>
+    <message>
+        <source>Loading files...</source>
+        <translation>ファイルを読み込んでいます...</translation>
+    </message>
+    <message>
+        <source>Saving files...</source>
+        <translation>ファイルを保存しています...</translation>
+    </message>
     <message>
         <source>Save Error</source>
         <translation>保存エラー</translation>
@@ -0,0 +1,49 @@
+"""Tests for mainwindow module"""
+
+from pathlib import Path
+
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QMessageBox
+
+from shoboi_tag_editor import mainwindow
+from shoboi_tag_editor.mainwindow import MainWindow
+from shoboi_tag_editor.metadata import TrackMetadata
+
+
+@pytest.fixture
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def window(qapp, monkeypatch):
+    monkeypatch.setattr(QMessageBox, "information", lambda *args: None)
+    return MainWindow()
+
+
+class TestMainWindow:
+    def test_save_clears_reverted_edits(self, window, monkeypatch):
+        written = []
+        monkeypatch.setattr(mainwindow, "write_metadata", written.append)
+        model = window._model
+        tracks = [
+            TrackMetadata(file_path=Path(f"/test/song{i}.mp3"), title=f"Song {i}")
+            for i in range(2)
+        ]
+        model.add_tracks(tracks)
+        model.setData(model.index(0, 2), "Edited", Qt.ItemDataRole.EditRole)
+        # Edited and then reverted, so there is nothing to write
+        model.setData(model.index(1, 2), "Edited", Qt.ItemDataRole.EditRole)
+        model.setData(model.index(1, 2), "Song 1", Qt.ItemDataRole.EditRole)
+
+        window._on_save()
+
+        assert written == [tracks[0]]
+        assert model.get_modified_tracks() == []
+        assert model.data(model.index(1, 2), Qt.ItemDataRole.BackgroundRole) is None
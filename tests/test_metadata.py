@@ -7,10 +7,21 @@ import pytest
 from shoboi_tag_editor.metadata import (
     SUPPORTED_EXTENSIONS,
     TrackMetadata,
+    find_supported_files,
     is_supported_file,
+    read_metadata,
+    write_metadata,
 )
 
 
+@pytest.fixture
+def mp3_file(tmp_path):
+    # MPEG-1 Layer III, 128 kbps, 44.1 kHz frames without any ID3 tag
+    path = tmp_path / "song.mp3"
+    path.write_bytes((b"\xff\xfb\x90\x00" + b"\x00" * 413) * 20)
+    return path
+
+
 class TestTrackMetadata:
     def test_default_values(self):
         path = Path("/test/file.mp3")
@@ -68,6 +79,7 @@ class TestTrackMetadata:
         assert target.track_number == "5"
         assert target.year == "2023"
         assert target.genre == "Jazz"
+        assert target.cover_dirty is True
 
     def test_modified_not_compared(self):
         path = Path("/test/file.mp3")
@@ -76,6 +88,11 @@ class TestTrackMetadata:
 
         assert meta1 == meta2
 
+    def test_file_name(self):
+        meta = TrackMetadata(file_path=Path("/test/dir/file.mp3"))
+
+        assert meta.file_name == "file.mp3"
+
 
 class TestIsSupportedFile:
     @pytest.mark.parametrize("ext", SUPPORTED_EXTENSIONS)
@@ -92,3 +109,73 @@ class TestIsSupportedFile:
     def test_unsupported_extensions(self, ext):
         path = Path(f"/test/file{ext}")
         assert is_supported_file(path) is False
+
+
+class TestFindSupportedFiles:
+    def test_finds_nested_files(self, tmp_path):
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        for name in ["a.mp3", "sub/b.FLAC", "sub/deeper/c.m4a", "cover.jpg", "sub/notes.txt"]:
+            (tmp_path / name).touch()
+
+        found = set(find_supported_files(tmp_path))
+
+        assert found == {
+            tmp_path / "a.mp3",
+            tmp_path / "sub" / "b.FLAC",
+            tmp_path / "sub" / "deeper" / "c.m4a",
+        }
+
+    def test_empty_directory(self, tmp_path):
+        assert list(find_supported_files(tmp_path)) == []
+
+
+class TestMp3Metadata:
+    def test_read_untagged(self, mp3_file):
+        meta = read_metadata(mp3_file)
+
+        assert meta.title == ""
+        assert meta.cover_image is None
+
+    def test_write_and_read(self, mp3_file):
+        meta = TrackMetadata(
+            file_path=mp3_file,
+            title="Test Title",
+            artist="Test Artist",
+            album="Test Album",
+            track_number="1",
+            year="2024",
+            genre="Rock",
+            cover_image=b"\x89PNG\r\n\x1a\n",
+            cover_mime="image/png",
+            modified=True,
+            cover_dirty=True,
+        )
+        write_metadata(meta)
+
+        loaded = read_metadata(mp3_file)
+        assert loaded == meta
+        assert loaded.cover_image == b"\x89PNG\r\n\x1a\n"
+        assert loaded.cover_mime == "image/png"
+        assert meta.modified is False
+        assert meta.cover_dirty is False
+
+    def test_write_keeps_clean_cover(self, mp3_file):
+        meta = TrackMetadata(file_path=mp3_file, cover_image=b"\xff\xd8\xff", cover_dirty=True)
+        write_metadata(meta)
+
+        # A text-only edit must not touch the embedded cover
+        meta.title = "New Title"
+        meta.cover_image = None
+        write_metadata(meta)
+
+        loaded = read_metadata(mp3_file)
+        assert loaded.title == "New Title"
+        assert loaded.cover_image == b"\xff\xd8\xff"
+
+    def test_failed_write_keeps_modified(self, tmp_path):
+        meta = TrackMetadata(file_path=tmp_path / "missing.mp3", title="New Title", modified=True)
+
+        with pytest.raises(Exception):
+            write_metadata(meta)
+
+        assert meta.modified is True
@@ -3,7 +3,8 @@
 from pathlib import Path
 
 import pytest
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QBuffer, QIODevice, Qt, QThreadPool
+from PyQt6.QtGui import QImage, QPixmapCache
 
 from shoboi_tag_editor.metadata import TrackMetadata
 from shoboi_tag_editor.tablemodel import MetadataTableModel
@@ -27,6 +28,16 @@ def sample_track():
     )
 
 
+@pytest.fixture
+def png_data(qapp):
+    image = QImage(100, 100, QImage.Format.Format_RGB32)
+    image.fill(Qt.GlobalColor.red)
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+
 @pytest.fixture
 def qapp():
     from PyQt6.QtWidgets import QApplication
@@ -56,10 +67,62 @@ class TestMetadataTableModel:
 
         assert model.rowCount() == 3
 
+    def test_add_tracks_fetches_in_chunks(self, model):
+        count = model.FETCH_CHUNK * 2 + 1
+        tracks = [TrackMetadata(file_path=Path(f"/test/song{i}.mp3")) for i in range(count)]
+        model.add_tracks(tracks)
+
+        assert model.rowCount() == model.FETCH_CHUNK
+        assert model.canFetchMore() is True
+        assert len(model.get_all_tracks()) == count
+        assert model.has_file(Path(f"/test/song{count - 1}.mp3")) is True
+
+        model.fetchMore()
+        model.fetchMore()
+
+        assert model.rowCount() == count
+        assert model.canFetchMore() is False
+
+    def test_fetch_all(self, model):
+        count = model.FETCH_CHUNK + 5
+        tracks = [TrackMetadata(file_path=Path(f"/test/song{i}.mp3")) for i in range(count)]
+        model.add_tracks(tracks)
+
+        model.fetch_all()
+
+        assert model.rowCount() == len(tracks)
+        assert not model.canFetchMore()
+
+    def test_clear_drops_pending_tracks(self, model):
+        tracks = [
+            TrackMetadata(file_path=Path(f"/test/song{i}.mp3"))
+            for i in range(model.FETCH_CHUNK + 1)
+        ]
+        model.add_tracks(tracks)
+
+        model.clear()
+
+        assert model.rowCount() == 0
+        assert model.canFetchMore() is False
+        assert model.get_all_tracks() == []
+
     def test_add_empty_tracks(self, model):
         model.add_tracks([])
         assert model.rowCount() == 0
 
+    def test_add_unique(self, model, sample_track):
+        model.add_track(sample_track)
+        tracks = [
+            TrackMetadata(file_path=Path("/test/song.mp3")),
+            TrackMetadata(file_path=Path("/test/new.mp3")),
+            TrackMetadata(file_path=Path("/test/new.mp3")),
+        ]
+
+        added = model.add_unique(tracks)
+
+        assert added == [tracks[1]]
+        assert model.rowCount() == 2
+
     def test_clear(self, model, sample_track):
         model.add_track(sample_track)
         assert model.rowCount() == 1
@@ -90,6 +153,18 @@ class TestMetadataTableModel:
         index = model.index(0, 3)
         assert model.data(index, Qt.ItemDataRole.DisplayRole) == "Test Artist"
 
+    def test_data_unhandled_role(self, model, sample_track):
+        model.add_track(sample_track)
+
+        assert model.data(model.index(0, 2), Qt.ItemDataRole.ToolTipRole) is None
+
+    def test_display_text(self, model, sample_track):
+        model.add_track(sample_track)
+
+        assert model.display_text(0, 0) == ""
+        assert model.display_text(0, 1) == "song.mp3"
+        assert model.display_text(0, 3) == "Test Artist"
+
     def test_data_invalid_index(self, model, sample_track):
         model.add_track(sample_track)
 
@@ -119,6 +194,81 @@ class TestMetadataTableModel:
         modified = model.get_modified_tracks()
         assert len(modified) == 1
 
+    def test_modified_background_shared(self, model, sample_track):
+        model.add_track(sample_track)
+        model.setData(model.index(0, 2), "New Title", Qt.ItemDataRole.EditRole)
+
+        # Every highlighted cell returns the same QColor instead of a new one
+        backgrounds = [
+            model.data(model.index(0, col), Qt.ItemDataRole.BackgroundRole)
+            for col in range(model.columnCount())
+        ]
+        assert backgrounds[0] is not None
+        assert all(bg is backgrounds[0] for bg in backgrounds)
+
+    def test_set_cover_marks_cover_dirty(self, model, sample_track):
+        model.add_track(sample_track)
+
+        index = model.index(0, 0)
+        result = model.setData(index, (b"data", "image/png"), Qt.ItemDataRole.UserRole)
+
+        assert result is True
+        assert sample_track.cover_dirty is True
+        assert sample_track.modified is True
+
+    def test_cover_pixmap_decoded_in_background(self, qapp, model, sample_track, png_data):
+        QPixmapCache.clear()
+        sample_track.cover_image = png_data
+        model.add_track(sample_track)
+        index = model.index(0, 0)
+
+        assert model.data(index, Qt.ItemDataRole.DecorationRole) is None
+
+        QThreadPool.globalInstance().waitForDone()
+        qapp.processEvents()
+        pixmap = model.data(index, Qt.ItemDataRole.DecorationRole)
+
+        assert pixmap.width() == model.COVER_WIDTH
+        assert pixmap.height() == model.COVER_HEIGHT
+        assert QPixmapCache.find(sample_track.cover_key) is not None
+
+    def test_thumbnail_repaints_requesting_row(self, qapp, model, png_data):
+        QPixmapCache.clear()
+        tracks = [TrackMetadata(file_path=Path(f"/test/song{i}.mp3")) for i in range(3)]
+        tracks[1].cover_image = png_data
+        model.add_tracks(tracks)
+        emitted = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: emitted.append((top.row(), bottom.row(), top.column()))
+        )
+
+        model.data(model.index(1, 0), Qt.ItemDataRole.DecorationRole)
+        QThreadPool.globalInstance().waitForDone()
+        qapp.processEvents()
+
+        # Only the cover cell of the requesting row is repainted
+        assert emitted == [(1, 1, 0)]
+
+    def test_cover_disabled(self, model, sample_track, png_data):
+        sample_track.cover_image = png_data
+        model.add_track(sample_track)
+        model.set_cover_enabled(False)
+
+        assert model.data(model.index(0, 0), Qt.ItemDataRole.DecorationRole) is None
+        # No thumbnail job is scheduled
+        assert sample_track.cover_key is None
+
+    def test_set_cover_resets_cover_key(self, model, sample_track, png_data):
+        sample_track.cover_image = png_data
+        model.add_track(sample_track)
+        model.data(model.index(0, 0), Qt.ItemDataRole.DecorationRole)
+        assert sample_track.cover_key is not None
+
+        model.setData(model.index(0, 0), (b"data", "image/png"), Qt.ItemDataRole.UserRole)
+
+        assert sample_track.cover_key is None
+        QThreadPool.globalInstance().waitForDone()
+
     def test_set_data_same_value(self, model, sample_track):
         model.add_track(sample_track)
 
@@ -137,6 +287,89 @@ class TestMetadataTableModel:
 
         assert result is False
 
+    def test_set_data_bulk(self, model):
+        tracks = [
+            TrackMetadata(file_path=Path(f"/test/song{i}.mp3"), artist="Old" if i else "New")
+            for i in range(3)
+        ]
+        model.add_tracks(tracks)
+        changes = []
+        model.dataChanged.connect(lambda top, bottom, roles: changes.append((top.row(), bottom.row())))
+
+        result = model.set_data_bulk([0, 1, 2], 3, "New")
+
+        assert result is True
+        assert [t.artist for t in tracks] == ["New", "New", "New"]
+        assert model.get_modified_tracks() == tracks[1:]
+        assert changes == [(1, 2)]
+
+    def test_set_data_bulk_filename_readonly(self, model, sample_track):
+        model.add_track(sample_track)
+
+        result = model.set_data_bulk([0], 1, "new_name.mp3")
+
+        assert result is False
+        assert model.get_modified_tracks() == []
+
+    def test_bulk_edit(self, model):
+        tracks = [TrackMetadata(file_path=Path(f"/test/song{i}.mp3")) for i in range(5)]
+        model.add_tracks(tracks)
+        emitted = []
+        model.dataChanged.connect(
+            lambda top, bottom, roles: emitted.append((top.row(), bottom.row(), top.column()))
+        )
+
+        model.begin_bulk_edit()
+        for row in (1, 3):
+            model.setData(model.index(row, 2), "Title", Qt.ItemDataRole.EditRole)
+        model.setData(model.index(2, 3), "Artist", Qt.ItemDataRole.EditRole)
+        assert emitted == []
+        model.end_bulk_edit()
+
+        # One signal per column spanning the changed rows
+        assert emitted == [(1, 3, 2), (2, 2, 3)]
+        assert [t.title for t in tracks] == ["", "Title", "", "Title", ""]
+        assert len(model.get_modified_tracks()) == 3
+
+    def test_nested_bulk_edit(self, model, sample_track):
+        model.add_track(sample_track)
+        emitted = []
+        model.dataChanged.connect(lambda *args: emitted.append(args))
+
+        model.begin_bulk_edit()
+        model.begin_bulk_edit()
+        model.setData(model.index(0, 2), "New Title", Qt.ItemDataRole.EditRole)
+        model.end_bulk_edit()
+        assert emitted == []
+        model.end_bulk_edit()
+
+        assert len(emitted) == 1
+
+    def test_unmatched_end_bulk_edit(self, model, sample_track):
+        model.add_track(sample_track)
+        emitted = []
+        model.dataChanged.connect(lambda *args: emitted.append(args))
+
+        model.end_bulk_edit()
+        model.setData(model.index(0, 2), "New Title", Qt.ItemDataRole.EditRole)
+
+        assert len(emitted) == 1
+
+    def test_bulk_edit_context_on_error(self, model, sample_track):
+        model.add_track(sample_track)
+        emitted = []
+        model.dataChanged.connect(lambda *args: emitted.append(args))
+
+        with pytest.raises(ValueError):
+            with model.bulk_edit():
+                model.setData(model.index(0, 2), "New Title", Qt.ItemDataRole.EditRole)
+                raise ValueError
+
+        # The collected change is emitted and the model is not left muted
+        assert len(emitted) == 1
+        model.setData(model.index(0, 3), "New Artist", Qt.ItemDataRole.EditRole)
+        assert len(emitted) == 2
+
     def test_flags_cover_not_editable(self, model, sample_track):
         model.add_track(sample_track)
 
@@ -164,12 +397,25 @@ class TestMetadataTableModel:
             flags = model.flags(index)
             assert flags & Qt.ItemFlag.ItemIsEditable
 
+    def test_editable_columns(self, model):
+        # Cover and Filename are excluded
+        assert model.editable_columns() == (2, 3, 4, 5, 6, 7)
+
+    def test_non_text_editable_columns(self, model):
+        assert model.non_text_editable_columns() == frozenset({0, 1})
+
     def test_has_file(self, model, sample_track):
         model.add_track(sample_track)
 
         assert model.has_file(Path("/test/song.mp3")) is True
         assert model.has_file(Path("/test/other.mp3")) is False
 
+    def test_has_file_after_clear(self, model, sample_track):
+        model.add_track(sample_track)
+        model.clear()
+
+        assert model.has_file(Path("/test/song.mp3")) is False
+
     def test_get_modified_tracks(self, model):
         tracks = [
             TrackMetadata(file_path=Path(f"/test/song{i}.mp3"), title=f"Song {i}")
@@ -185,6 +431,18 @@ class TestMetadataTableModel:
         assert len(modified) == 1
         assert modified[0].title == "Modified"
 
+    def test_get_modified_tracks_in_row_order(self, model):
+        tracks = [
+            TrackMetadata(file_path=Path(f"/test/song{i}.mp3"), title=f"Song {i}")
+            for i in range(3)
+        ]
+        model.add_tracks(tracks)
+
+        model.setData(model.index(2, 2), "Modified 2", Qt.ItemDataRole.EditRole)
+        model.setData(model.index(0, 2), "Modified 0", Qt.ItemDataRole.EditRole)
+
+        assert model.get_modified_tracks() == [tracks[0], tracks[2]]
+
     def test_get_all_tracks(self, model):
         tracks = [
             TrackMetadata(file_path=Path(f"/test/song{i}.mp3"))
@@ -212,6 +470,40 @@ class TestMetadataTableModel:
 
         assert len(model.get_modified_tracks()) == 0
 
+    def test_mark_all_saved_skips_failed_writes(self, model):
+        tracks = [
+            TrackMetadata(file_path=Path(f"/test/song{i}.mp3"), title=f"Song {i}")
+            for i in range(2)
+        ]
+        model.add_tracks(tracks)
+        model.setData(model.index(0, 2), "Modified 1", Qt.ItemDataRole.EditRole)
+        model.setData(model.index(1, 2), "Modified 2", Qt.ItemDataRole.EditRole)
+
+        # Writing the second track failed
+        model.mark_all_saved([tracks[0]])
+
+        assert model.get_modified_tracks() == [tracks[1]]
+        assert tracks[1].modified is True
+        assert model.original_for(tracks[1]).title == "Song 1"
+        assert model.original_for(tracks[0]).title == "Modified 1"
+
+    def test_original_for(self, model, sample_track):
+        model.add_track(sample_track)
+
+        model.setData(model.index(0, 2), "New Title", Qt.ItemDataRole.EditRole)
+
+        original = model.original_for(sample_track)
+        assert original.title == "Test Song"
+        assert original != sample_track
+
+    def test_original_for_after_save(self, model, sample_track):
+        model.add_track(sample_track)
+
+        model.setData(model.index(0, 2), "New Title", Qt.ItemDataRole.EditRole)
+        model.mark_all_saved()
+
+        assert model.original_for(sample_track) == sample_track
+
     def test_header_data(self, model):
         # Cover column (0)
         header = model.headerData(0, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole)
@@ -0,0 +1,90 @@
+"""Tests for tableview module"""
+
+from pathlib import Path
+
+import pytest
+from PyQt6.QtCore import QBuffer, QIODevice, QPoint, Qt
+from PyQt6.QtGui import QImage
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+
+from shoboi_tag_editor.metadata import TrackMetadata
+from shoboi_tag_editor.tablemodel import MetadataTableModel
+from shoboi_tag_editor.tableview import NavigableTableView
+
+
+@pytest.fixture
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def view(qapp):
+    view = NavigableTableView()
+    view.setModel(MetadataTableModel(view))
+    return view
+
+
+class TestNavigableTableView:
+    def test_select_all_delete_reaches_unfetched_tracks(self, view):
+        model = view.model()
+        count = model.FETCH_CHUNK * 2 + 1
+        tracks = [
+            TrackMetadata(file_path=Path(f"/test/song{i}.mp3"), title=f"Song {i}")
+            for i in range(count)
+        ]
+        model.add_tracks(tracks)
+        assert model.rowCount() < count
+
+        view.setCurrentIndex(model.index(0, 2))
+        QTest.keyClick(view, Qt.Key.Key_A, Qt.KeyboardModifier.ControlModifier)
+        QTest.keyClick(view, Qt.Key.Key_Delete)
+
+        assert model.rowCount() == count
+        assert all(track.title == "" for track in tracks)
+        assert len(model.get_modified_tracks()) == count
+
+    def test_column_header_delete_reaches_unfetched_tracks(self, view):
+        model = view.model()
+        count = model.FETCH_CHUNK * 2 + 1
+        tracks = [
+            TrackMetadata(file_path=Path(f"/test/song{i}.mp3"), title=f"Song {i}")
+            for i in range(count)
+        ]
+        model.add_tracks(tracks)
+        view.show()
+
+        header = view.horizontalHeader()
+        pos = QPoint(header.sectionViewportPosition(2) + header.sectionSize(2) // 2, 5)
+        QTest.mouseClick(header.viewport(), Qt.MouseButton.LeftButton, pos=pos)
+        QTest.keyClick(view, Qt.Key.Key_Delete)
+
+        assert model.rowCount() == count
+        assert all(track.title == "" for track in tracks)
+
+    def test_copy_png_cover_offers_bytes_and_image(self, qapp, view):
+        image = QImage(10, 10, QImage.Format.Format_RGB32)
+        image.fill(Qt.GlobalColor.red)
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, "PNG")
+        png_data = bytes(buffer.data())
+
+        model = view.model()
+        track = TrackMetadata(
+            file_path=Path("/test/song.mp3"), cover_image=png_data, cover_mime="image/png"
+        )
+        model.add_track(track)
+        view.setCurrentIndex(model.index(0, 0))
+        QTest.keyClick(view, Qt.Key.Key_C, Qt.KeyboardModifier.ControlModifier)
+
+        mime_data = QApplication.clipboard().mimeData()
+        # The stored bytes for pasting as is, and an image for other applications
+        assert bytes(mime_data.data("image/png")) == png_data
+        assert mime_data.hasImage()
+        assert QApplication.clipboard().image().size() == image.size()